@@ -1,10 +1,14 @@
 use crate::engine::{
     Progression, advance_progress, apply_rewards, is_command_relevant, validate_task_logic,
 };
-use crate::quest::{Course, Library};
+use crate::quest::{Chapter, Course, Library, Quest, Task};
 use crate::state::GameState;
 use crate::ui;
 use crate::world::WorldEngine;
+use anyhow::Context;
+use include_dir::Dir;
+use std::borrow::Cow;
+use std::fs;
 use std::path::{Path, PathBuf};
 
 // --- OUTCOME TYPE ---
@@ -42,6 +46,26 @@ pub fn resolve_course_path(game: &GameState, lib: &Library) -> Option<PathBuf> {
     None
 }
 
+/// Write the bundled library into `target`, skipping files whose on-disk
+/// contents already match. Runs on every invocation, so the common case
+/// must be read-only.
+pub fn sync_bundled_library(library: &Dir, target: &Path) -> anyhow::Result<()> {
+    for file in library.files() {
+        let path = target.join(file.path());
+        if fs::read(&path).is_ok_and(|existing| existing == file.contents()) {
+            continue;
+        }
+        if let Some(parent) = path.parent() {
+            fs::create_dir_all(parent).with_context(|| format!("Failed to create {parent:?}"))?;
+        }
+        fs::write(&path, file.contents()).with_context(|| format!("Failed to write {path:?}"))?;
+    }
+    for dir in library.dirs() {
+        sync_bundled_library(dir, target)?;
+    }
+    Ok(())
+}
+
 pub fn reset_game(save_path: &Path) -> GameState {
     if save_path.exists() {
         std::fs::remove_file(save_path).expect("Failed to delete save file");
@@ -92,12 +116,11 @@ pub fn perform_validation(path_str: &str) {
 }
 
 pub fn handle_refresh_sequence(game: &GameState, course: &Course) {
+    // Resolved once and shared by the intro cutscene and the status card.
+    let active = active_content(game, course);
+
     if game.current_task_index == 0 {
-        if let Some((_, chapter, _)) = course.get_active_content(
-            &game.current_quest_id,
-            game.current_chapter_index,
-            game.current_task_index,
-        ) {
+        if let Some((_, chapter, _)) = active {
             ui::play_cutscene(&chapter.intro);
             print!("\x1b[2J\x1b[H");
         }
@@ -105,20 +128,31 @@ pub fn handle_refresh_sequence(game: &GameState, course: &Course) {
         println!();
     }
 
-    handle_status_display(game, course);
+    draw_status(game, active);
 }
 
 pub fn handle_status_display(game: &GameState, course: &Course) {
+    draw_status(game, active_content(game, course));
+}
+
+fn active_content<'a>(
+    game: &GameState,
+    course: &'a Course,
+) -> Option<(&'a Quest, &'a Chapter, &'a Task)> {
+    course.get_active_content(
+        &game.current_quest_id,
+        game.current_chapter_index,
+        game.current_task_index,
+    )
+}
+
+fn draw_status(game: &GameState, active: Option<(&Quest, &Chapter, &Task)>) {
     if game.is_finished {
         println!(">> [SYSTEM] Quest Complete. Run 'supershell --menu' for more.");
         return;
     }
 
-    if let Some((quest, chapter, task)) = course.get_active_content(
-        &game.current_quest_id,
-        game.current_chapter_index,
-        game.current_task_index,
-    ) {
+    if let Some((quest, chapter, task)) = active {
         ui::draw_status_card(
             &quest.title,
             &chapter.title,
@@ -134,17 +168,30 @@ pub fn handle_status_display(game: &GameState, course: &Course) {
 /// tab-completed paths (e.g. `cd Sector_A/`) match patterns written
 /// without the slash (e.g. `^cd\s+Sector_A\s*$`).
 /// A lone `/` token is preserved.
-fn normalize_cmd(cmd: &str) -> String {
-    cmd.split_whitespace()
-        .map(|t| {
-            if t.len() > 1 {
-                t.trim_end_matches('/')
-            } else {
-                t
-            }
-        })
-        .collect::<Vec<_>>()
-        .join(" ")
+fn normalize_cmd(cmd: &str) -> Cow<'_, str> {
+    // Most commands already arrive normalized; borrow those as-is.
+    let already_normal = cmd.split(' ').all(|token| {
+        !token.is_empty()
+            && !token.contains(char::is_whitespace)
+            && (token.len() == 1 || !token.ends_with('/'))
+    });
+    if already_normal {
+        return Cow::Borrowed(cmd);
+    }
+
+    // Single pass into one preallocated buffer; no intermediate token Vec.
+    let mut normalized = String::with_capacity(cmd.len());
+    for (i, token) in cmd.split_whitespace().enumerate() {
+        if i > 0 {
+            normalized.push(' ');
+        }
+        if token.len() > 1 {
+            normalized.push_str(token.trim_end_matches('/'));
+        } else {
+            normalized.push_str(token);
+        }
+    }
+    Cow::Owned(normalized)
 }
 
 pub fn handle_check_command(
@@ -156,6 +203,12 @@ pub fn handle_check_command(
     save_path: &Path,
     world: &WorldEngine,
 ) -> CheckCommandOutcome {
+    // Nothing to evaluate (module finished, or the save points past the
+    // course): skip the world checks and setup entirely.
+    let Some((quest, chapter, task)) = active_content(game, course) else {
+        return CheckCommandOutcome::NoChange;
+    };
+
     let user_cmd = &normalize_cmd(user_cmd);
 
     // Auto-restore if the Construct was destroyed (e.g. `rm -rf ~/Construct`)
@@ -166,87 +219,96 @@ pub fn handle_check_command(
     }
 
     // Run chapter setup on the first task of a chapter or after world destruction
-    if construct_destroyed || game.current_task_index == 0 {
-        if let Some(quest) = course.quests.iter().find(|q| q.id == game.current_quest_id) {
-            if let Some(chapter) = quest.chapters.get(game.current_chapter_index) {
-                if !chapter.setup_actions.is_empty() {
-                    if construct_destroyed {
-                        println!(">> [SYSTEM] Reconfiguring Construct...");
-                    }
-                    world.build_scenario(&chapter.setup_actions);
-                }
-            }
+    if (construct_destroyed || game.current_task_index == 0) && !chapter.setup_actions.is_empty() {
+        if construct_destroyed {
+            println!(">> [SYSTEM] Reconfiguring Construct...");
         }
+        world.build_scenario(&chapter.setup_actions);
     }
 
-    if let Some((quest, chapter, task)) = course.get_active_content(
-        &game.current_quest_id,
-        game.current_chapter_index,
-        game.current_task_index,
-    ) {
-        // --- PASS 1: RELEVANCE (Permissive) ---
-        if !is_command_relevant(user_cmd, task, game) {
-            return CheckCommandOutcome::NoChange;
-        }
-
-        // If the command itself failed (non-zero exit), don't validate logic —
-        // the shell already told the user something went wrong.
-        if command_status.is_some_and(|s| s != 0) {
-            return CheckCommandOutcome::NoChange;
-        }
+    // --- PASS 1: RELEVANCE (Permissive) ---
+    if !is_command_relevant(user_cmd, task, game) {
+        return CheckCommandOutcome::NoChange;
+    }
 
-        // --- PASS 2: LOGIC (Strict) ---
-        if let Err(msg) = validate_task_logic(user_cmd, task, game, cwd_override) {
-            game.failure_count += 1;
-            save_game_state(game, save_path);
-            let hint = if game.failure_count >= 3 && !task.hint.is_empty() {
-                task.hint.as_str()
-            } else {
-                ""
-            };
-            ui::print_fail(&msg, hint);
-            return CheckCommandOutcome::LogicFailure;
-        }
+    // If the command itself failed (non-zero exit), don't validate logic —
+    // the shell already told the user something went wrong.
+    if command_status.is_some_and(|s| s != 0) {
+        return CheckCommandOutcome::NoChange;
+    }
 
-        // --- SUCCESS ---
-        println!("\r\n");
-        ui::print_success(&task.success_msg);
+    // --- PASS 2: LOGIC (Strict) ---
+    if let Err(msg) = validate_task_logic(user_cmd, task, game, cwd_override) {
+        game.failure_count += 1;
+        save_game_state(game, save_path);
+        let hint = if game.failure_count >= 3 && !task.hint.is_empty() {
+            task.hint.as_str()
+        } else {
+            ""
+        };
+        ui::print_fail(&msg, hint);
+        return CheckCommandOutcome::LogicFailure;
+    }
 
-        apply_rewards(game, &task.rewards);
-        game.failure_count = 0;
+    // --- SUCCESS ---
+    ui::print_success(&task.success_msg);
 
-        let progression = advance_progress(game, chapter.tasks.len(), quest.chapters.len());
+    apply_rewards(game, &task.rewards);
+    game.failure_count = 0;
 
-        match progression {
-            Progression::NextTask => {
-                println!("\n\x1b[0;90m[ PRESS ENTER TO CONTINUE ]\x1b[0m");
-                let mut s = String::new();
-                std::io::stdin().read_line(&mut s).unwrap();
-            }
-            Progression::NextChapter => {
-                ui::play_cutscene(&chapter.outro);
-
-                let next_chapter = &quest.chapters[game.current_chapter_index];
-                if !next_chapter.setup_actions.is_empty() {
-                    println!(">> [SYSTEM] Reconfiguring Construct...");
-                    world.build_scenario(&next_chapter.setup_actions);
-                }
-            }
-            Progression::ModuleComplete => {
-                ui::play_cutscene(&chapter.outro);
-                println!("\n\x1b[1;32m>> [SYSTEM] ALL MODULES COMPLETE. DISCONNECTING...\x1b[0m");
+    let progression = advance_progress(game, chapter.tasks.len(), quest.chapters.len());
 
-                save_game_state(game, save_path);
+    match progression {
+        Progression::NextTask => {
+            println!("\n\x1b[0;90m[ PRESS ENTER TO CONTINUE ]\x1b[0m");
+            let mut s = String::new();
+            std::io::stdin().read_line(&mut s).unwrap();
+        }
+        Progression::NextChapter => {
+            ui::play_cutscene(&chapter.outro);
 
-                return CheckCommandOutcome::RefreshUi;
+            let next_chapter = &quest.chapters[game.current_chapter_index];
+            if !next_chapter.setup_actions.is_empty() {
+                println!(">> [SYSTEM] Reconfiguring Construct...");
+                world.build_scenario(&next_chapter.setup_actions);
             }
         }
+        Progression::ModuleComplete => {
+            ui::play_cutscene(&chapter.outro);
+            println!("\n\x1b[1;32m>> [SYSTEM] ALL MODULES COMPLETE. DISCONNECTING...\x1b[0m");
+
+            save_game_state(game, save_path);
 
-        if !save_game_state(game, save_path) {
-            return CheckCommandOutcome::NoChange;
+            return CheckCommandOutcome::RefreshUi;
         }
-        return CheckCommandOutcome::RefreshUi;
     }
 
-    CheckCommandOutcome::NoChange
+    if !save_game_state(game, save_path) {
+        return CheckCommandOutcome::NoChange;
+    }
+    CheckCommandOutcome::RefreshUi
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn normalize_cmd_strips_trailing_slashes_from_tokens() {
+        assert_eq!(normalize_cmd("cd Sector_A/"), "cd Sector_A");
+        assert_eq!(normalize_cmd("ls -la a/ b//"), "ls -la a b");
+    }
+
+    #[test]
+    fn normalize_cmd_borrows_already_normalized_commands() {
+        assert!(matches!(normalize_cmd("cd Sector_A"), Cow::Borrowed(_)));
+        assert!(matches!(normalize_cmd("cd /"), Cow::Borrowed(_)));
+        assert!(matches!(normalize_cmd("ls "), Cow::Owned(_)));
+    }
+
+    #[test]
+    fn normalize_cmd_collapses_whitespace_and_keeps_lone_slash() {
+        assert_eq!(normalize_cmd("  cd   /  "), "cd /");
+        assert_eq!(normalize_cmd(""), "");
+    }
 }
@@ -1,8 +1,13 @@
 use directories::UserDirs;
 use std::path::{Component, Path, PathBuf};
+use std::sync::OnceLock;
 
-pub fn default_construct_root() -> Option<PathBuf> {
-    UserDirs::new().map(|user_dirs| user_dirs.home_dir().join("Construct"))
+/// `~/Construct`, resolved once per process. Every sandboxed condition
+/// asks for it, and the home directory does not move mid-run.
+pub fn default_construct_root() -> Option<&'static Path> {
+    static ROOT: OnceLock<Option<PathBuf>> = OnceLock::new();
+    ROOT.get_or_init(|| UserDirs::new().map(|user_dirs| user_dirs.home_dir().join("Construct")))
+        .as_deref()
 }
 
 pub fn resolve_construct_path(root: &Path, relative_path: &str) -> Option<PathBuf> {
@@ -1,5 +1,6 @@
-use crate::quest::{Condition, ConditionType, Reward, Task, ValidationResult};
+use crate::quest::{Condition, ConditionType, Reward, StatCache, Task, ValidationResult};
 use crate::state::GameState;
+use regex::RegexSet;
 use std::path::Path;
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -10,6 +11,33 @@ pub enum Progression {
 }
 
 pub fn is_command_relevant(user_cmd: &str, task: &Task, game: &GameState) -> bool {
+    let patterns: Vec<&str> = task
+        .conditions
+        .iter()
+        .filter_map(|condition| match &condition.condition_type {
+            ConditionType::CommandMatches { pattern } => Some(pattern.as_str()),
+            _ => None,
+        })
+        .collect();
+
+    // Most commands are irrelevant and most patterns are anchored to a
+    // literal verb (`^ls...`), so a prefix test rules the command out
+    // without compiling any regex.
+    let could_match = patterns
+        .iter()
+        .any(|pattern| literal_prefix(pattern).is_none_or(|prefix| user_cmd.starts_with(prefix)));
+    if !could_match {
+        return false;
+    }
+
+    // All of the task's command patterns compile into one set and the
+    // command is scanned once, however many alternatives the task accepts.
+    if let Ok(set) = RegexSet::new(patterns) {
+        return set.is_match(user_cmd);
+    }
+
+    // One invalid pattern poisons the whole set. Fall back to per-condition
+    // checks so the valid patterns still match and the bad one is reported.
     task.conditions
         .iter()
         .filter(|condition| is_command_match_condition(condition))
@@ -22,19 +50,32 @@ pub fn validate_task_logic(
     game: &GameState,
     cwd_override: Option<&Path>,
 ) -> Result<(), String> {
+    // Every condition is checked in one pass over a shared StatCache, so the
+    // player sees all unmet requirements at once, one per line.
+    let stats = StatCache::default();
+    let mut failures: Vec<String> = Vec::new();
+
     for condition in &task.conditions {
         if is_command_match_condition(condition) {
             continue;
         }
 
-        match condition.check_with_cwd(user_cmd, game, cwd_override) {
+        match condition.check_with_stats(user_cmd, game, cwd_override, &stats) {
             ValidationResult::Valid => continue,
-            ValidationResult::LogicError(message) => return Err(message),
+            ValidationResult::LogicError(message) => {
+                if !failures.contains(&message) {
+                    failures.push(message);
+                }
+            }
             ValidationResult::SyntaxError => continue,
         }
     }
 
-    Ok(())
+    if failures.is_empty() {
+        Ok(())
+    } else {
+        Err(failures.join("\n"))
+    }
 }
 
 pub fn apply_rewards(game: &mut GameState, rewards: &[Reward]) {
@@ -68,6 +109,51 @@ pub fn advance_progress(
     }
 }
 
+/// The literal text every match of a `^`-anchored pattern starts with, e.g.
+/// `ls` for `^ls(\s.*)?$`. `None` when it can't be read off cheaply
+/// (unanchored, escapes or groups first, character classes anywhere, or
+/// top-level alternation).
+fn literal_prefix(pattern: &str) -> Option<&str> {
+    let rest = pattern.strip_prefix('^')?;
+    // Class syntax (`[]]`, `[^]]`, nested sets) is too easy to misread when
+    // scanning for `|`, and a wrong answer hides a relevant command.
+    if rest.contains('[') || has_top_level_alternation(rest) {
+        return None;
+    }
+
+    let end = rest
+        .find(|c: char| !(c.is_ascii_alphanumeric() || c == '_' || c == '-'))
+        .unwrap_or(rest.len());
+    // A quantifier makes the last literal character optional.
+    let prefix = match rest[end..].chars().next() {
+        Some('?' | '*' | '{') => &rest[..end.saturating_sub(1)],
+        _ => &rest[..end],
+    };
+
+    (!prefix.is_empty()).then_some(prefix)
+}
+
+/// Callers rule out character classes first, so only escapes and groups
+/// need tracking here.
+fn has_top_level_alternation(pattern: &str) -> bool {
+    let mut depth = 0usize;
+    let mut chars = pattern.chars();
+
+    while let Some(c) = chars.next() {
+        match c {
+            '\\' => {
+                chars.next();
+            }
+            '(' => depth += 1,
+            ')' => depth = depth.saturating_sub(1),
+            '|' if depth == 0 => return true,
+            _ => {}
+        }
+    }
+
+    false
+}
+
 fn is_command_match_condition(condition: &Condition) -> bool {
     matches!(
         condition.condition_type,
@@ -127,6 +213,65 @@ mod tests {
         assert!(!is_command_relevant("pwd", &task, &game));
     }
 
+    #[test]
+    fn command_is_relevant_when_any_command_condition_matches() {
+        let game = GameState::new();
+        let task = task_with_conditions(vec![
+            command_condition(r"^ls(\s.*)?$"),
+            command_condition(r"^dir$"),
+        ]);
+
+        assert!(is_command_relevant("dir", &task, &game));
+        assert!(!is_command_relevant("pwd", &task, &game));
+    }
+
+    #[test]
+    fn invalid_command_pattern_does_not_mask_valid_ones() {
+        let game = GameState::new();
+        let task = task_with_conditions(vec![
+            command_condition(r"^ls("),
+            command_condition(r"^ls(\s.*)?$"),
+        ]);
+
+        assert!(is_command_relevant("ls -la", &task, &game));
+        assert!(!is_command_relevant("pwd", &task, &game));
+    }
+
+    #[test]
+    fn literal_prefix_reads_leading_verb_from_anchored_patterns() {
+        assert_eq!(literal_prefix(r"^ls(\s.*)?$"), Some("ls"));
+        assert_eq!(
+            literal_prefix(r"^ls\s+(-la|-al)\s+mission_files\s*$"),
+            Some("ls")
+        );
+        assert_eq!(literal_prefix(r"^lss?$"), Some("ls"));
+        assert_eq!(literal_prefix(r"ls$"), None);
+        assert_eq!(literal_prefix(r"^ls|^dir"), None);
+        assert_eq!(literal_prefix(r"^(?i)ls"), None);
+        assert_eq!(literal_prefix(r"^ls[](]|^dir"), None);
+        assert_eq!(literal_prefix(r"^ls[^]|]|^dir"), None);
+    }
+
+    #[test]
+    fn command_is_relevant_for_alternation_after_a_bracket_class() {
+        let game = GameState::new();
+        let task = task_with_conditions(vec![command_condition(r"^ls[](]|^dir")]);
+
+        assert!(is_command_relevant("dir", &task, &game));
+    }
+
+    #[test]
+    fn command_is_relevant_for_unanchored_patterns() {
+        let game = GameState::new();
+        let task = task_with_conditions(vec![
+            command_condition(r"^cd\s+Sector_A\s*$"),
+            command_condition(r"(?i)^LS$"),
+        ]);
+
+        assert!(is_command_relevant("ls", &task, &game));
+        assert!(!is_command_relevant("pwd", &task, &game));
+    }
+
     #[test]
     fn logic_validation_returns_error_when_non_command_condition_fails() {
         let game = GameState::new();
@@ -140,6 +285,24 @@ mod tests {
         assert_eq!(result, Err("Scanner is not enabled.".to_string()));
     }
 
+    #[test]
+    fn logic_validation_reports_every_failed_condition() {
+        let game = GameState::new();
+        let task = task_with_conditions(vec![
+            command_condition(r"^ls$"),
+            flag_condition("scanner_enabled", "Scanner is not enabled."),
+            flag_condition("uplink_ready", "Uplink is offline."),
+            flag_condition("scanner_enabled", "Scanner is not enabled."),
+        ]);
+
+        let result = validate_task_logic("ls", &task, &game, None);
+
+        assert_eq!(
+            result,
+            Err("Scanner is not enabled.\nUplink is offline.".to_string())
+        );
+    }
+
     #[test]
     fn logic_validation_passes_when_non_command_conditions_pass() {
         let mut game = GameState::new();
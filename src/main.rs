@@ -10,11 +10,13 @@ mod ui;
 mod world;
 
 use anyhow::{Context, Result};
+use app::CheckCommandOutcome;
 use clap::Parser;
 use include_dir::{Dir, include_dir};
-use paths::build_app_context;
+use paths::{AppContext, build_app_context};
 use quest::{Course, Library};
 use state::GameState;
+use std::io::Write;
 use std::path::PathBuf;
 use world::WorldEngine;
 
@@ -48,6 +50,51 @@ struct Cli {
     refresh: bool,
 }
 
+/// The action an invocation performs, resolved once from the flags.
+enum Mode {
+    Validate(String),
+    Menu,
+    Play(Session),
+}
+
+/// Modes that run against the active course.
+enum Session {
+    Check {
+        command: String,
+        cwd: Option<PathBuf>,
+        command_status: Option<i32>,
+        refresh: bool,
+    },
+    Status,
+    Refresh,
+    Shell,
+}
+
+impl Cli {
+    /// Precedence: `--validate`, `--menu`, `--check`, `--status`, then
+    /// `--refresh`; with none of them set we launch the shell.
+    /// `--check --refresh` redraws the mission card in-process on completion.
+    fn mode(self) -> Mode {
+        if let Some(path_str) = self.validate {
+            return Mode::Validate(path_str);
+        }
+        if self.menu {
+            return Mode::Menu;
+        }
+        Mode::Play(match (self.check, self.status, self.refresh) {
+            (Some(command), _, _) => Session::Check {
+                command,
+                cwd: self.cwd,
+                command_status: self.command_status,
+                refresh: self.refresh,
+            },
+            (None, true, _) => Session::Status,
+            (None, false, true) => Session::Refresh,
+            (None, false, false) => Session::Shell,
+        })
+    }
+}
+
 // --- MAIN ENTRY POINT ---
 
 fn main() {
@@ -59,51 +106,67 @@ fn main() {
 
 fn run() -> Result<()> {
     let args = Cli::parse();
+    let reset = args.reset;
+    let mode = args.mode();
 
     let ctx = build_app_context();
 
-    if let Some(path_str) = args.validate {
-        app::perform_validation(&path_str);
-        return Ok(());
+    match mode {
+        // Validation only reads the given file; skip all startup work.
+        Mode::Validate(path_str) => app::perform_validation(&path_str),
+        Mode::Menu => {
+            let (mut game, lib) = open_game(&ctx, reset)?;
+            select_module(&mut game, &lib, &ctx);
+        }
+        Mode::Play(session) => {
+            let (game, lib) = open_game(&ctx, reset)?;
+            play(session, game, &lib, &ctx)?;
+        }
     }
 
+    Ok(())
+}
+
+/// Sync the bundled library and load (or reset) the save file.
+fn open_game(ctx: &AppContext, reset: bool) -> Result<(GameState, Library)> {
     std::fs::create_dir_all(&ctx.library_path).context("Failed to create library dir")?;
-    DEFAULT_LIBRARY
-        .extract(&ctx.library_path)
+    app::sync_bundled_library(&DEFAULT_LIBRARY, &ctx.library_path)
         .context("Failed to extract default library")?;
 
-    let mut game = if args.reset {
+    let game = if reset {
         app::reset_game(&ctx.save_path)
     } else {
         GameState::load(ctx.save_path.to_str().unwrap())
     };
 
-    let lib = Library::new(ctx.library_path.clone());
-    let mut active_course_path = app::resolve_course_path(&game, &lib);
-
-    if args.menu {
-        active_course_path = ui::show_module_menu(lib.list_available_courses());
-        if let Some(ref path) = active_course_path {
-            game.current_course = path.file_name().unwrap().to_string_lossy().to_string();
-            game.current_quest_id = String::new();
-            game.current_chapter_index = 0;
-            game.current_task_index = 0;
-            game.is_finished = false;
-            app::save_game_state(&game, &ctx.save_path);
-
-            if std::env::var("CONSTRUCT_UPLINK").is_ok() {
-                println!("\n>> [SYSTEM] Module selection saved.");
-                println!(
-                    ">> [SYSTEM] Type 'exit' to leave the Construct, then run 'supershell' to play your selection."
-                );
-            } else {
-                println!("\n>> [SYSTEM] Module selected. Run 'supershell' to begin.");
-            }
-        }
-        return Ok(());
+    let lib = Library::new(ctx.library_path.clone(), ctx.cache_path.clone());
+    Ok((game, lib))
+}
+
+fn select_module(game: &mut GameState, lib: &Library, ctx: &AppContext) {
+    let Some(path) = ui::show_module_menu(lib.list_available_courses()) else {
+        return;
+    };
+
+    game.current_course = path.file_name().unwrap().to_string_lossy().to_string();
+    game.current_quest_id = String::new();
+    game.current_chapter_index = 0;
+    game.current_task_index = 0;
+    game.is_finished = false;
+    app::save_game_state(game, &ctx.save_path);
+
+    if std::env::var("CONSTRUCT_UPLINK").is_ok() {
+        println!("\n>> [SYSTEM] Module selection saved.");
+        println!(
+            ">> [SYSTEM] Type 'exit' to leave the Construct, then run 'supershell' to play your selection."
+        );
+    } else {
+        println!("\n>> [SYSTEM] Module selected. Run 'supershell' to begin.");
     }
+}
 
-    let course_path = match active_course_path {
+fn play(session: Session, mut game: GameState, lib: &Library, ctx: &AppContext) -> Result<()> {
+    let course_path = match app::resolve_course_path(&game, lib) {
         Some(p) => p,
         None => {
             eprintln!(">> [ERROR] No module selected. Run 'supershell --menu'.");
@@ -116,11 +179,15 @@ fn run() -> Result<()> {
         return Ok(());
     }
 
-    let course = Course::load(&course_path).context("Failed to load course")?;
+    let course =
+        Course::load_cached(&course_path, &ctx.cache_path).context("Failed to load course")?;
+
+    // Startup bookkeeping is collected and written to disk at most once.
+    let mut state_changed = false;
 
     if game.course_version != course.version {
         game.course_version = course.version.clone();
-        app::save_game_state(&game, &ctx.save_path);
+        state_changed = true;
     }
 
     let world = WorldEngine::new()?;
@@ -129,29 +196,42 @@ fn run() -> Result<()> {
     if game.current_quest_id.is_empty() {
         if let Some(first_quest) = course.quests.first() {
             game.current_quest_id = first_quest.id.clone();
-            app::save_game_state(&game, &ctx.save_path);
+            state_changed = true;
         }
     }
 
-    let check_cwd = args.cwd.clone();
-    let command_status = args.command_status;
-    if let Some(cmd) = args.check {
-        let outcome = app::handle_check_command(
-            &cmd,
-            check_cwd.as_deref(),
+    if state_changed {
+        app::save_game_state(&game, &ctx.save_path);
+    }
+
+    match session {
+        Session::Check {
+            command,
+            cwd,
             command_status,
-            &mut game,
-            &course,
-            &ctx.save_path,
-            &world,
-        );
-        std::process::exit(outcome.exit_code());
-    } else if args.status {
-        app::handle_status_display(&game, &course);
-    } else if args.refresh {
-        app::handle_refresh_sequence(&game, &course);
-    } else {
-        shell::launch_infected_session()?;
+            refresh,
+        } => {
+            let outcome = app::handle_check_command(
+                &command,
+                cwd.as_deref(),
+                command_status,
+                &mut game,
+                &course,
+                &ctx.save_path,
+                &world,
+            );
+            // Saves the shell spawning `clear` and a second full startup
+            // just to redraw the card.
+            if refresh && outcome == CheckCommandOutcome::RefreshUi {
+                print!("\x1b[2J\x1b[H");
+                app::handle_refresh_sequence(&game, &course);
+            }
+            std::io::stdout().flush().ok();
+            std::process::exit(outcome.exit_code());
+        }
+        Session::Status => app::handle_status_display(&game, &course),
+        Session::Refresh => app::handle_refresh_sequence(&game, &course),
+        Session::Shell => shell::launch_infected_session()?,
     }
 
     Ok(())
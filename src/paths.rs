@@ -4,6 +4,7 @@ use std::path::PathBuf;
 pub struct AppContext {
     pub library_path: PathBuf,
     pub save_path: PathBuf,
+    pub cache_path: PathBuf,
 }
 
 pub fn build_app_context() -> AppContext {
@@ -22,5 +23,6 @@ pub fn build_app_context() -> AppContext {
     AppContext {
         library_path: data_dir.join("library"),
         save_path: data_dir.join("save.json"),
+        cache_path: data_dir.join("cache"),
     }
 }
@@ -3,10 +3,17 @@ use crate::construct::{default_construct_root, resolve_construct_path};
 use crate::state::GameState;
 use anyhow::Context;
 use regex::Regex;
+use regex::bytes::Regex as BytesRegex;
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
+use std::cell::RefCell;
+use std::collections::HashMap;
 use std::env;
 use std::fs;
+use std::hash::{DefaultHasher, Hash, Hasher};
 use std::path::{Path, PathBuf};
+use std::rc::Rc;
+use std::time::{Duration, UNIX_EPOCH};
 
 #[cfg(unix)]
 use std::os::unix::fs::PermissionsExt;
@@ -14,33 +21,43 @@ use std::os::unix::fs::PermissionsExt;
 // --- LIBRARY & COURSE STRUCTS ---
 pub struct Library {
     pub root_dir: PathBuf,
+    cache_dir: PathBuf,
 }
 
 impl Library {
-    pub fn new(root_dir: PathBuf) -> Self {
-        Self { root_dir }
+    pub fn new(root_dir: PathBuf, cache_dir: PathBuf) -> Self {
+        Self {
+            root_dir,
+            cache_dir,
+        }
     }
 
     pub fn list_available_courses(&self) -> Vec<(PathBuf, String)> {
         let mut courses = Vec::new();
         if let Ok(entries) = fs::read_dir(&self.root_dir) {
             for entry in entries.flatten() {
+                // Filter on the bare file name and the directory entry's type
+                // before building a full path for anything.
+                let file_name = entry.file_name();
+                let is_course = Path::new(&file_name)
+                    .extension()
+                    .is_some_and(|ext| ext == "yaml" || ext == "yml");
+                if !is_course || entry.file_type().is_ok_and(|kind| kind.is_dir()) {
+                    continue;
+                }
+
                 let path = entry.path();
-                if let Some(ext) = path.extension() {
-                    if ext == "yaml" || ext == "yml" {
-                        match Course::load(&path) {
-                            Ok(course) => {
-                                let display_name = if course.title == "Untitled Course" {
-                                    path.file_stem().unwrap().to_string_lossy().to_string()
-                                } else {
-                                    course.title
-                                };
-                                courses.push((path, display_name));
-                            }
-                            Err(e) => {
-                                eprintln!(">> [WARN] Skipping {:?}: {e}", path);
-                            }
-                        }
+                match Course::load_cached(&path, &self.cache_dir) {
+                    Ok(course) => {
+                        let display_name = if course.title == "Untitled Course" {
+                            path.file_stem().unwrap().to_string_lossy().to_string()
+                        } else {
+                            course.title
+                        };
+                        courses.push((path, display_name));
+                    }
+                    Err(e) => {
+                        eprintln!(">> [WARN] Skipping {:?}: {e}", path);
                     }
                 }
             }
@@ -72,34 +89,87 @@ fn default_version() -> String {
 }
 
 impl Course {
-    pub fn load(path: &Path) -> anyhow::Result<Self> {
-        if !path.exists() {
-            return Ok(Course {
-                title: default_title(),
-                author: default_author(),
-                version: default_version(),
-                quests: vec![],
-            });
+    /// Load a course from YAML, keeping a JSON copy of the parsed course in
+    /// `cache_dir` keyed by a hash of the YAML source. Every `--check` parses
+    /// the active course, and JSON deserializes far faster than YAML. When the
+    /// file's mtime and size match the cache, this skips reading and hashing
+    /// the YAML. Cache failures are never fatal: a bad or stale cache is just
+    /// a miss.
+    pub fn load_cached(path: &Path, cache_dir: &Path) -> anyhow::Result<Self> {
+        let Ok(metadata) = fs::metadata(path) else {
+            return Ok(Self::empty());
+        };
+        let read_source =
+            || fs::read_to_string(path).with_context(|| format!("Failed to read {path:?}"));
+
+        let Some(file_name) = path.file_name() else {
+            return Self::parse(&read_source()?, path);
+        };
+        // Keyed on the full file name so `intro.yaml` and `intro.yml` never
+        // share an entry.
+        let mut cache_name = file_name.to_os_string();
+        cache_name.push(".json");
+        let cache_path = cache_dir.join(cache_name);
+        let cached = fs::read_to_string(&cache_path)
+            .ok()
+            .and_then(|json| serde_json::from_str::<CourseCache>(&json).ok());
+
+        // Same version, mtime and size as when cached: skip reading and
+        // hashing the source entirely.
+        let source_stamp = source_stamp(path, &metadata);
+        let cached = match cached {
+            Some(cached) if source_stamp.is_some() && cached.source_stamp == source_stamp => {
+                return Ok(cached.course);
+            }
+            other => other,
+        };
+
+        let content = read_source()?;
+        let source_hash = hash_source(path, &content);
+        let course = match cached {
+            Some(cached) if cached.source_hash == source_hash => {
+                if cached.source_stamp == source_stamp {
+                    return Ok(cached.course);
+                }
+                // Content unchanged; rewrite only to record the new stamp.
+                cached.course
+            }
+            _ => Self::parse(&content, path)?,
+        };
+        let cache = CourseCache {
+            source_hash,
+            source_stamp,
+            course,
+        };
+        if let Err(err) = write_cache(&cache_path, &cache) {
+            eprintln!(">> [WARN] Failed to cache {path:?}: {err}");
+        }
+        Ok(cache.course)
+    }
+
+    fn empty() -> Self {
+        Course {
+            title: default_title(),
+            author: default_author(),
+            version: default_version(),
+            quests: vec![],
         }
-        let content =
-            fs::read_to_string(path).with_context(|| format!("Failed to read {path:?}"))?;
-        if let Ok(course) = serde_yml::from_str::<Course>(&content) {
+    }
+
+    fn parse(content: &str, path: &Path) -> anyhow::Result<Self> {
+        if let Ok(course) = serde_yml::from_str::<Course>(content) {
             return Ok(course);
         }
-        if let Ok(quests) = serde_yml::from_str::<Vec<Quest>>(&content) {
+        if let Ok(quests) = serde_yml::from_str::<Vec<Quest>>(content) {
             return Ok(Course {
-                title: default_title(),
-                author: default_author(),
-                version: default_version(),
                 quests,
+                ..Self::empty()
             });
         }
-        if let Ok(quest) = serde_yml::from_str::<Quest>(&content) {
+        if let Ok(quest) = serde_yml::from_str::<Quest>(content) {
             return Ok(Course {
-                title: default_title(),
-                author: default_author(),
-                version: default_version(),
                 quests: vec![quest],
+                ..Self::empty()
             });
         }
         Err(anyhow::anyhow!(
@@ -107,19 +177,81 @@ impl Course {
         ))
     }
 
+    /// Look up a quest by id. The first quest with a given id wins.
+    pub fn find_quest(&self, quest_id: &str) -> Option<&Quest> {
+        self.quests.iter().find(|q| q.id == quest_id)
+    }
+
     pub fn get_active_content(
         &self,
         quest_id: &str,
         chapter_idx: usize,
         task_idx: usize,
     ) -> Option<(&Quest, &Chapter, &Task)> {
-        let quest = self.quests.iter().find(|q| q.id == quest_id)?;
+        let quest = self.find_quest(quest_id)?;
         let chapter = quest.chapters.get(chapter_idx)?;
         let task = chapter.tasks.get(task_idx)?;
         Some((quest, chapter, task))
     }
 }
 
+// --- PARSED COURSE CACHE ---
+
+#[derive(Serialize, Deserialize)]
+struct CourseCache {
+    source_hash: u64,
+    #[serde(default)]
+    source_stamp: Option<u64>,
+    course: Course,
+}
+
+/// Bump whenever `CourseCache` or the course data model changes shape. The
+/// crate version alone is not enough: it does not move during development.
+const CACHE_FORMAT: u32 = 1;
+
+/// Sources modified more recently than this are always re-hashed.
+const STAMP_SETTLE_TIME: Duration = Duration::from_secs(2);
+
+/// Cache format, binary version, path, mtime and size of the source file.
+/// `None` while the mtime is too fresh to trust: timestamps are coarse, so a
+/// same-size edit within one tick would otherwise look unchanged.
+fn source_stamp(path: &Path, metadata: &fs::Metadata) -> Option<u64> {
+    let modified = metadata.modified().ok()?;
+    if !modified.elapsed().is_ok_and(|age| age >= STAMP_SETTLE_TIME) {
+        return None;
+    }
+
+    let mut hasher = DefaultHasher::new();
+    CACHE_FORMAT.hash(&mut hasher);
+    env!("CARGO_PKG_VERSION").hash(&mut hasher);
+    path.hash(&mut hasher);
+    modified.duration_since(UNIX_EPOCH).ok()?.hash(&mut hasher);
+    metadata.len().hash(&mut hasher);
+    Some(hasher.finish())
+}
+
+/// Hash the YAML source together with its path, the cache format and the
+/// binary version, so a new build never trusts a cache written by an older
+/// data model.
+fn hash_source(path: &Path, content: &str) -> u64 {
+    let mut hasher = DefaultHasher::new();
+    CACHE_FORMAT.hash(&mut hasher);
+    env!("CARGO_PKG_VERSION").hash(&mut hasher);
+    path.hash(&mut hasher);
+    content.hash(&mut hasher);
+    hasher.finish()
+}
+
+fn write_cache(cache_path: &Path, cache: &CourseCache) -> anyhow::Result<()> {
+    if let Some(parent) = cache_path.parent() {
+        fs::create_dir_all(parent)?;
+    }
+    let tmp_path = cache_path.with_extension("json.tmp");
+    fs::write(&tmp_path, serde_json::to_string(cache)?)?;
+    fs::rename(tmp_path, cache_path)?;
+    Ok(())
+}
+
 #[derive(Debug, Serialize, Deserialize, Clone)]
 pub struct Quest {
     #[serde(alias = "name")]
@@ -175,6 +307,34 @@ pub enum ValidationResult {
     LogicError(String), // State check failed (Command right, context wrong)
 }
 
+/// `fs::metadata` results (and file contents) for one validation pass, keyed
+/// by path. Conditions that inspect the same file share one `stat` and one
+/// read; building a fresh cache per pass keeps results from going stale
+/// between commands.
+#[derive(Default)]
+pub struct StatCache {
+    entries: RefCell<HashMap<PathBuf, Option<fs::Metadata>>>,
+    contents: RefCell<HashMap<PathBuf, Option<Rc<[u8]>>>>,
+}
+
+impl StatCache {
+    pub fn metadata(&self, path: &Path) -> Option<fs::Metadata> {
+        self.entries
+            .borrow_mut()
+            .entry(path.to_path_buf())
+            .or_insert_with(|| fs::metadata(path).ok())
+            .clone()
+    }
+
+    pub fn contents(&self, path: &Path) -> Option<Rc<[u8]>> {
+        self.contents
+            .borrow_mut()
+            .entry(path.to_path_buf())
+            .or_insert_with(|| fs::read(path).ok().map(Rc::from))
+            .clone()
+    }
+}
+
 #[derive(Debug, Serialize, Deserialize, Clone)]
 #[serde(tag = "type")]
 pub enum ConditionType {
@@ -216,7 +376,7 @@ pub struct Condition {
 
 impl Condition {
     fn get_sandbox_path(path: &str) -> Option<PathBuf> {
-        default_construct_root().and_then(|root| resolve_construct_path(&root, path))
+        default_construct_root().and_then(|root| resolve_construct_path(root, path))
     }
 
     pub fn check(&self, user_command: &str, state: &GameState) -> ValidationResult {
@@ -228,6 +388,18 @@ impl Condition {
         user_command: &str,
         state: &GameState,
         cwd_override: Option<&Path>,
+    ) -> ValidationResult {
+        self.check_with_stats(user_command, state, cwd_override, &StatCache::default())
+    }
+
+    /// Like `check_with_cwd`, sharing filesystem lookups with the other
+    /// conditions checked in the same pass.
+    pub fn check_with_stats(
+        &self,
+        user_command: &str,
+        state: &GameState,
+        cwd_override: Option<&Path>,
+        stats: &StatCache,
     ) -> ValidationResult {
         let is_valid = match &self.condition_type {
             ConditionType::CommandMatches { pattern } => match Regex::new(pattern) {
@@ -243,6 +415,9 @@ impl Condition {
                     return ValidationResult::SyntaxError;
                 }
             },
+            // Content checks match raw bytes: no UTF-8 validation pass over
+            // the whole file, and a stray non-UTF-8 byte no longer makes the
+            // file unreadable.
             ConditionType::HistoryContains { pattern } => {
                 let histfile = std::env::var("HISTFILE").unwrap_or_else(|_| {
                     std::env::var("HOME")
@@ -252,7 +427,7 @@ impl Condition {
                 if histfile.is_empty() {
                     false
                 } else {
-                    match (fs::read_to_string(&histfile), Regex::new(pattern)) {
+                    match (fs::read(&histfile), BytesRegex::new(pattern)) {
                         (Ok(content), Ok(re)) => re.is_match(&content),
                         (_, Err(_)) => {
                             eprintln!(">> [WARN] Invalid regex in HistoryContains: '{pattern}'");
@@ -264,29 +439,26 @@ impl Condition {
             }
             // --- SANDBOXED CHECKS ---
             ConditionType::PathExists { path } => Self::get_sandbox_path(path)
-                .map(|sandbox_path| sandbox_path.exists())
-                .unwrap_or(false),
+                .and_then(|sandbox_path| stats.metadata(&sandbox_path))
+                .is_some(),
             ConditionType::PathMissing { path } => Self::get_sandbox_path(path)
-                .map(|sandbox_path| !sandbox_path.exists())
-                .unwrap_or(false),
+                .is_some_and(|sandbox_path| stats.metadata(&sandbox_path).is_none()),
             ConditionType::IsDirectory { path } => Self::get_sandbox_path(path)
-                .map(|sandbox_path| sandbox_path.is_dir())
-                .unwrap_or(false),
+                .and_then(|sandbox_path| stats.metadata(&sandbox_path))
+                .is_some_and(|metadata| metadata.is_dir()),
             ConditionType::IsFile { path } => Self::get_sandbox_path(path)
-                .map(|sandbox_path| sandbox_path.is_file())
-                .unwrap_or(false),
+                .and_then(|sandbox_path| stats.metadata(&sandbox_path))
+                .is_some_and(|metadata| metadata.is_file()),
             ConditionType::IsExecutable { path } => {
-                if let Some(sandbox_path) = Self::get_sandbox_path(path) {
-                    if let Ok(metadata) = fs::metadata(sandbox_path) {
-                        #[cfg(unix)]
-                        {
-                            metadata.permissions().mode() & 0o111 != 0
-                        }
-                        #[cfg(not(unix))]
-                        {
-                            false
-                        }
-                    } else {
+                if let Some(metadata) = Self::get_sandbox_path(path)
+                    .and_then(|sandbox_path| stats.metadata(&sandbox_path))
+                {
+                    #[cfg(unix)]
+                    {
+                        metadata.permissions().mode() & 0o111 != 0
+                    }
+                    #[cfg(not(unix))]
+                    {
                         false
                     }
                 } else {
@@ -295,8 +467,8 @@ impl Condition {
             }
             ConditionType::FileContains { path, pattern } => {
                 if let Some(sandbox_path) = Self::get_sandbox_path(path) {
-                    if let Ok(content) = fs::read_to_string(sandbox_path) {
-                        Regex::new(pattern)
+                    if let Some(content) = stats.contents(&sandbox_path) {
+                        BytesRegex::new(pattern)
                             .map(|re| re.is_match(&content))
                             .unwrap_or(false)
                     } else {
@@ -308,8 +480,8 @@ impl Condition {
             }
             ConditionType::FileNotContains { path, pattern } => {
                 if let Some(sandbox_path) = Self::get_sandbox_path(path) {
-                    if let Ok(content) = fs::read_to_string(sandbox_path) {
-                        Regex::new(pattern)
+                    if let Some(content) = stats.contents(&sandbox_path) {
+                        BytesRegex::new(pattern)
                             .map(|re| !re.is_match(&content))
                             .unwrap_or(true)
                     } else {
@@ -320,18 +492,18 @@ impl Condition {
                 }
             }
             ConditionType::FileEmpty { path } => Self::get_sandbox_path(path)
-                .and_then(|sandbox_path| fs::metadata(sandbox_path).ok())
+                .and_then(|sandbox_path| stats.metadata(&sandbox_path))
                 .map(|metadata| metadata.len() == 0)
                 .unwrap_or(false),
 
             // --- ENV CHECKS ---
             ConditionType::WorkingDir { path } => {
-                let current = cwd_override
-                    .map(|cwd| cwd.to_path_buf())
-                    .or_else(|| env::current_dir().ok())
-                    .unwrap_or_default()
-                    .to_string_lossy()
-                    .to_string();
+                // `_g` always passes --cwd, so borrow it rather than copying.
+                let current = match cwd_override {
+                    Some(cwd) => Cow::Borrowed(cwd),
+                    None => Cow::Owned(env::current_dir().unwrap_or_default()),
+                };
+                let current = current.to_string_lossy();
 
                 Regex::new(path)
                     .map(|re| re.is_match(&current))
@@ -412,4 +584,170 @@ mod tests {
             ValidationResult::LogicError("Condition not met.".to_string())
         );
     }
+
+    #[test]
+    fn stat_cache_reuses_metadata_within_a_pass() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let file = temp.path().join("probe.txt");
+        fs::write(&file, "data").unwrap();
+
+        let stats = StatCache::default();
+        assert_eq!(stats.metadata(&file).map(|m| m.len()), Some(4));
+
+        fs::remove_file(&file).unwrap();
+        assert!(stats.metadata(&file).is_some());
+        assert!(StatCache::default().metadata(&file).is_none());
+    }
+
+    #[test]
+    fn stat_cache_reads_each_file_once_per_pass() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let file = temp.path().join("access.log");
+        fs::write(&file, "ERROR 42").unwrap();
+
+        let stats = StatCache::default();
+        assert_eq!(stats.contents(&file).as_deref(), Some(&b"ERROR 42"[..]));
+
+        fs::write(&file, "cleared").unwrap();
+        assert_eq!(stats.contents(&file).as_deref(), Some(&b"ERROR 42"[..]));
+        assert!(stats.contents(&temp.path().join("missing.log")).is_none());
+    }
+
+    fn quest(id: &str, title: &str) -> Quest {
+        Quest {
+            id: id.to_string(),
+            title: title.to_string(),
+            construct: true,
+            chapters: vec![],
+        }
+    }
+
+    #[test]
+    fn list_available_courses_only_loads_yaml_files() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let root = temp.path().join("library");
+        fs::create_dir_all(root.join("nested.yaml")).unwrap();
+        fs::write(root.join("cached.yaml"), CACHE_FIXTURE).unwrap();
+        fs::write(root.join("notes.txt"), "not a course").unwrap();
+
+        let library = Library::new(root, temp.path().join("cache"));
+        let courses = library.list_available_courses();
+
+        assert_eq!(courses.len(), 1);
+        assert_eq!(courses[0].1, "Cache Fixture");
+    }
+
+    #[test]
+    fn find_quest_returns_first_match_by_id() {
+        let course = Course {
+            quests: vec![
+                quest("a", "First A"),
+                quest("b", "B"),
+                quest("a", "Second A"),
+            ],
+            ..Course::empty()
+        };
+
+        assert_eq!(course.find_quest("b").map(|q| q.title.as_str()), Some("B"));
+        assert_eq!(
+            course.find_quest("a").map(|q| q.title.as_str()),
+            Some("First A")
+        );
+        assert!(course.find_quest("missing").is_none());
+    }
+
+    const CACHE_FIXTURE: &str = r#"
+title: "Cache Fixture"
+quests:
+  - id: "cached"
+    title: "Cached Quest"
+    chapters: []
+"#;
+
+    #[test]
+    fn load_cached_writes_cache_and_reuses_it() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let course_path = temp.path().join("cached.yaml");
+        let cache_dir = temp.path().join("cache");
+        fs::write(&course_path, CACHE_FIXTURE).unwrap();
+
+        let first = Course::load_cached(&course_path, &cache_dir).unwrap();
+        assert!(cache_dir.join("cached.yaml.json").exists());
+
+        let second = Course::load_cached(&course_path, &cache_dir).unwrap();
+        assert_eq!(first.title, "Cache Fixture");
+        assert_eq!(second.title, first.title);
+        assert_eq!(second.quests[0].id, "cached");
+    }
+
+    #[test]
+    fn load_cached_reparses_when_source_changes() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let course_path = temp.path().join("cached.yaml");
+        let cache_dir = temp.path().join("cache");
+        fs::write(&course_path, CACHE_FIXTURE).unwrap();
+        Course::load_cached(&course_path, &cache_dir).unwrap();
+
+        fs::write(
+            &course_path,
+            CACHE_FIXTURE.replace("Cache Fixture", "Edited Fixture"),
+        )
+        .unwrap();
+
+        let course = Course::load_cached(&course_path, &cache_dir).unwrap();
+        assert_eq!(course.title, "Edited Fixture");
+    }
+
+    #[test]
+    fn load_cached_keeps_yaml_and_yml_sources_apart() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let cache_dir = temp.path().join("cache");
+        let yaml_path = temp.path().join("intro.yaml");
+        let yml_path = temp.path().join("intro.yml");
+        fs::write(&yaml_path, CACHE_FIXTURE).unwrap();
+        fs::write(
+            &yml_path,
+            CACHE_FIXTURE.replace("Cache Fixture", "Other Fixture"),
+        )
+        .unwrap();
+
+        let yaml = Course::load_cached(&yaml_path, &cache_dir).unwrap();
+        let yml = Course::load_cached(&yml_path, &cache_dir).unwrap();
+
+        assert_eq!(yaml.title, "Cache Fixture");
+        assert_eq!(yml.title, "Other Fixture");
+        assert!(cache_dir.join("intro.yaml.json").exists());
+        assert!(cache_dir.join("intro.yml.json").exists());
+    }
+
+    fn backdate(path: &Path, modified: std::time::SystemTime) {
+        fs::File::options()
+            .write(true)
+            .open(path)
+            .unwrap()
+            .set_modified(modified)
+            .unwrap();
+    }
+
+    #[test]
+    fn load_cached_trusts_settled_stamp_without_reading_source() {
+        let temp = tempfile::TempDir::new().unwrap();
+        let course_path = temp.path().join("cached.yaml");
+        let cache_dir = temp.path().join("cache");
+        let an_hour_ago = std::time::SystemTime::now() - Duration::from_secs(3600);
+        fs::write(&course_path, CACHE_FIXTURE).unwrap();
+        backdate(&course_path, an_hour_ago);
+        Course::load_cached(&course_path, &cache_dir).unwrap();
+
+        // Same size and mtime: the cached course is served as-is.
+        fs::write(
+            &course_path,
+            CACHE_FIXTURE.replace("Cache Fixture", "Stale Fixture"),
+        )
+        .unwrap();
+        backdate(&course_path, an_hour_ago);
+
+        let course = Course::load_cached(&course_path, &cache_dir).unwrap();
+        assert_eq!(course.title, "Cache Fixture");
+    }
 }
@@ -1,5 +1,5 @@
+use crate::construct::default_construct_root;
 use anyhow::Context;
-use directories::UserDirs;
 use std::io::Write;
 use std::process::Command;
 use tempfile::Builder;
@@ -39,13 +39,10 @@ function _g() {
     # Flush in-memory history so HistoryContains can read the current command
     history -a
 
-    "__BINARY_PATH__" --check "$cmd $*" --cwd "$post_cwd" --command-status "$real_status"
-    local check_status=$?
-
-    if [ "$check_status" -eq 2 ]; then
-        clear
-        "__BINARY_PATH__" --refresh
-    fi
+    # "${*:+ $*}" avoids a trailing space when the command has no arguments.
+    # --refresh: on task completion the binary redraws the screen itself,
+    # so no extra `clear` or `--refresh` process is spawned here.
+    "__BINARY_PATH__" --check "$cmd${*:+ $*}" --cwd "$post_cwd" --command-status "$real_status" --refresh
 
     return "$real_status"
 }
@@ -64,15 +61,7 @@ function help() {
 
 # 5. THE INFECTION (PUZZLE HOOKS)
 # We only hook commands relevant to puzzles.
-alias ls='_g ls'
-alias cd='_g cd'
-alias cat='_g cat'
-alias chmod='_g chmod'
-alias grep='_g grep'
-alias ssh='_g ssh'
-alias nano='_g nano'
-alias vim='_g vim'
-
+__HOOK_ALIASES__
 # 6. STARTUP SEQUENCE
 clear
 echo -e "\n\e[1;36m>> NEURAL LINK ESTABLISHED.\e[0m"
@@ -83,6 +72,16 @@ echo -e "\e[0;90m   (Type 'exit' to disconnect)\e[0m\n"
 "__BINARY_PATH__" --refresh
 "#;
 
+/// Commands routed through `_g`, in the order their aliases are defined.
+const HOOKED_COMMANDS: &[&str] = &["ls", "cd", "cat", "chmod", "grep", "ssh", "nano", "vim"];
+
+fn hook_aliases() -> String {
+    HOOKED_COMMANDS
+        .iter()
+        .map(|cmd| format!("alias {cmd}='_g {cmd}'\n"))
+        .collect()
+}
+
 pub fn launch_infected_session() -> anyhow::Result<()> {
     // 1. Check for nesting
     if std::env::var("CONSTRUCT_UPLINK").is_ok() {
@@ -100,8 +99,7 @@ pub fn launch_infected_session() -> anyhow::Result<()> {
         .into_owned();
 
     // 3. Resolve "~/Construct" to an absolute path
-    let user_dirs = UserDirs::new().context("Could not determine home directory")?;
-    let construct_path = user_dirs.home_dir().join("Construct");
+    let construct_path = default_construct_root().context("Could not determine home directory")?;
 
     // Safety check: Ensure the directory exists before dropping the user in.
     if !construct_path.exists() {
@@ -109,7 +107,9 @@ pub fn launch_infected_session() -> anyhow::Result<()> {
     }
 
     // 4. Inject path into the template
-    let rc_content = SHELL_RC_TEMPLATE.replace("__BINARY_PATH__", &current_exe);
+    let rc_content = SHELL_RC_TEMPLATE
+        .replace("__HOOK_ALIASES__", &hook_aliases())
+        .replace("__BINARY_PATH__", &current_exe);
 
     // 5. Create a temporary RC file
     let mut temp_rc = Builder::new()
@@ -140,3 +140,17 @@ pub fn launch_infected_session() -> anyhow::Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn hook_aliases_route_each_command_through_guard() {
+        let aliases = hook_aliases();
+
+        assert_eq!(aliases.lines().count(), HOOKED_COMMANDS.len());
+        assert!(aliases.starts_with("alias ls='_g ls'\n"));
+        assert!(aliases.contains("alias chmod='_g chmod'\n"));
+    }
+}
@@ -1,16 +1,16 @@
 use crossterm::{
     cursor::{MoveDown, MoveToColumn, MoveUp},
     event::{Event, KeyCode, KeyEventKind, poll, read},
-    execute,
+    execute, queue,
     style::{Attribute, Color, Print, ResetColor, SetAttribute, SetForegroundColor},
     terminal::{Clear, ClearType, disable_raw_mode, enable_raw_mode, size},
 };
 use std::env;
-use std::io::{Write, stdout};
+use std::io::{BufWriter, Write, stdout};
 use std::path::PathBuf;
 use std::thread;
 use std::time::Duration;
-use textwrap::fill;
+use textwrap::wrap;
 
 // --- VISUAL CONSTANTS ---
 const BORDER_COLOR: Color = Color::White;
@@ -46,9 +46,11 @@ pub fn draw_status_card(
 }
 
 pub fn print_success(msg: &str) {
-    let mut stdout = stdout();
-    execute!(
-        stdout,
+    // Spacer and banner go out as one write, like `print_fail`.
+    let mut out = BufWriter::new(stdout().lock());
+    queue!(
+        out,
+        Print("\r\n\n"),
         SetForegroundColor(Color::Cyan),
         SetAttribute(Attribute::Bold),
         Print("\r\n>> [SUCCESS] "),
@@ -58,6 +60,7 @@ pub fn print_success(msg: &str) {
         Print("\n\n")
     )
     .ok();
+    out.flush().ok();
 }
 
 /// Apply Unicode combining strikethrough (U+0336) to every character,
@@ -71,25 +74,35 @@ pub fn glitch_text(s: &str) -> String {
 }
 
 pub fn print_fail(error: &str, hint: &str) {
-    let mut stdout = stdout();
-    let glitched = glitch_text(error);
+    // Queue the whole failure block (and hint) and flush it in one write so
+    // the card never appears half-drawn.
+    let mut out = BufWriter::new(stdout().lock());
 
-    execute!(
-        stdout,
+    queue!(
+        out,
         SetForegroundColor(Color::Cyan),
         Print("[+] SYSTEM_INTEGRITY.. OK\n"),
         Print("[+] SYNTAX_VALIDATION. OK\n"),
         SetForegroundColor(Color::Red),
         Print("[-] EXECUTION......... FAIL\n"),
-        Print("    └── "),
-        Print(&glitched),
-        Print("\n\n"),
     )
     .ok();
 
+    // One branch per unmet condition; `error` holds one message per line.
+    let mut failures = error.lines().peekable();
+    while let Some(failure) = failures.next() {
+        let branch = if failures.peek().is_some() {
+            "    ├── "
+        } else {
+            "    └── "
+        };
+        queue!(out, Print(branch), Print(glitch_text(failure)), Print("\n")).ok();
+    }
+    queue!(out, Print("\n")).ok();
+
     if !hint.is_empty() {
-        execute!(
-            stdout,
+        queue!(
+            out,
             SetForegroundColor(Color::Yellow),
             Print(" >> HINT: "),
             SetAttribute(Attribute::Bold),
@@ -99,7 +112,8 @@ pub fn print_fail(error: &str, hint: &str) {
         )
         .ok();
     }
-    execute!(stdout, ResetColor).ok();
+    queue!(out, ResetColor).ok();
+    out.flush().ok();
 }
 
 /// Display a module selection menu and return the chosen course path.
@@ -143,8 +157,6 @@ fn render_inline_card(title: &str, raw_lines: Vec<String>, use_typewriter: bool)
         render_plain_card(title, &raw_lines, use_typewriter);
         return;
     }
-    let mut stdout = stdout();
-
     let (term_cols, term_rows) = size().unwrap_or((80, 24));
 
     // Fall back to plain renderer for constrained terminals.
@@ -157,46 +169,48 @@ fn render_inline_card(title: &str, raw_lines: Vec<String>, use_typewriter: bool)
     let width = std::cmp::min(term_cols, MAX_WIDTH);
     let content_width = (width as usize).saturating_sub(4);
 
+    // Wrapped lines borrow from the input; only lines that actually need
+    // breaking allocate.
     let mut final_lines = Vec::new();
-    for raw_line in raw_lines {
-        if raw_line.is_empty() {
-            final_lines.push("".to_string());
-        } else {
-            let wrapped = fill(&raw_line, content_width);
-            for subline in wrapped.split('\n') {
-                final_lines.push(subline.to_string());
-            }
-        }
+    for raw_line in &raw_lines {
+        final_lines.extend(wrap(raw_line, content_width));
     }
 
     let height = final_lines.len();
 
+    // All drawing is queued into one buffer. Static cards go out in a single
+    // flush; the typewriter flushes per character on purpose.
+    let mut out = BufWriter::new(stdout().lock());
+
     // Draw skeleton.
-    print_top_border(width, title);
+    queue_top_border(&mut out, width, title);
 
-    execute!(stdout, SetForegroundColor(BORDER_COLOR)).ok();
+    queue!(out, SetForegroundColor(BORDER_COLOR)).ok();
     for _ in 0..height {
-        print!("│");
-        print!("{}", " ".repeat(content_width + 2));
-        execute!(stdout, MoveToColumn(width - 1)).ok();
-        print!("│\r\n");
+        queue!(
+            out,
+            Print("│"),
+            Print(" ".repeat(content_width + 2)),
+            MoveToColumn(width - 1),
+            Print("│\r\n"),
+        )
+        .ok();
     }
-    print_bottom_border(width);
+    queue_bottom_border(&mut out, width);
 
     // Rewind to top of content area.
-    execute!(stdout, MoveUp((height + 1) as u16)).ok();
+    queue!(out, MoveUp((height + 1) as u16)).ok();
 
     // Fill content.
     let mut skipped = false;
 
-    for line in final_lines {
-        execute!(stdout, MoveToColumn(2)).ok();
-        execute!(stdout, SetForegroundColor(TEXT_COLOR)).ok();
+    for line in &final_lines {
+        queue!(out, MoveToColumn(2), SetForegroundColor(TEXT_COLOR)).ok();
 
         if use_typewriter {
             for char in line.chars() {
-                print!("{}", char);
-                stdout.flush().ok();
+                queue!(out, Print(char)).ok();
+                out.flush().ok();
 
                 if !skipped {
                     if poll(Duration::from_secs(0)).unwrap_or(false) {
@@ -212,19 +226,18 @@ fn render_inline_card(title: &str, raw_lines: Vec<String>, use_typewriter: bool)
                 }
             }
         } else {
-            print!("{}", line);
+            queue!(out, Print(line)).ok();
         }
 
-        execute!(stdout, MoveDown(1)).ok();
+        queue!(out, MoveDown(1)).ok();
     }
 
     // Move past the bottom border.
-    execute!(stdout, MoveDown(1)).ok();
-    execute!(stdout, MoveToColumn(0), ResetColor).ok();
+    queue!(out, MoveDown(1), MoveToColumn(0), ResetColor).ok();
 
     if use_typewriter {
-        print!("\r\n>> PRESS [ENTER] TO CONTINUE...");
-        stdout.flush().ok();
+        queue!(out, Print("\r\n>> PRESS [ENTER] TO CONTINUE...")).ok();
+        out.flush().ok();
 
         loop {
             match read() {
@@ -237,10 +250,10 @@ fn render_inline_card(title: &str, raw_lines: Vec<String>, use_typewriter: bool)
                 _ => {}
             }
         }
-        print!("\r\n");
-    } else {
-        print!("\r\n");
     }
+    queue!(out, Print("\r\n")).ok();
+    out.flush().ok();
+    drop(out);
 
     // CRITICAL: always restore the terminal before returning.
     disable_raw_mode().ok();
@@ -402,39 +415,35 @@ fn numbered_menu(courses: &[(PathBuf, String)]) -> Option<PathBuf> {
 
 // --- BORDER HELPERS ---
 
-fn print_top_border(width: u16, title: &str) {
-    let mut stdout = stdout();
-    execute!(stdout, SetForegroundColor(BORDER_COLOR)).ok();
-    print!("┌──");
+fn queue_top_border(out: &mut impl Write, width: u16, title: &str) {
+    let used_len = 3 + 1 + title.chars().count() + 1;
+    let remaining = (width as usize).saturating_sub(used_len + 1);
 
-    execute!(
-        stdout,
+    queue!(
+        out,
+        SetForegroundColor(BORDER_COLOR),
+        Print("┌──"),
         SetForegroundColor(TITLE_COLOR),
-        SetAttribute(Attribute::Bold)
+        SetAttribute(Attribute::Bold),
+        Print(format!(" {} ", title)),
+        SetForegroundColor(BORDER_COLOR),
+        SetAttribute(Attribute::Reset),
+        Print("─".repeat(remaining)),
+        MoveToColumn(width - 1),
+        Print("┐\r\n"),
     )
     .ok();
-    print!(" {} ", title);
+}
 
-    execute!(
-        stdout,
+fn queue_bottom_border(out: &mut impl Write, width: u16) {
+    queue!(
+        out,
         SetForegroundColor(BORDER_COLOR),
-        SetAttribute(Attribute::Reset)
+        Print("└"),
+        Print("─".repeat((width as usize).saturating_sub(2))),
+        MoveToColumn(width - 1),
+        Print("┘\r\n"),
+        ResetColor,
     )
     .ok();
-
-    let used_len = 3 + 1 + title.chars().count() + 1;
-    let remaining = (width as usize).saturating_sub(used_len + 1);
-
-    print!("{}", "─".repeat(remaining));
-    execute!(stdout, MoveToColumn(width - 1)).ok();
-    print!("┐\r\n");
-}
-
-fn print_bottom_border(width: u16) {
-    let mut stdout = stdout();
-    execute!(stdout, SetForegroundColor(BORDER_COLOR)).ok();
-    print!("└{}", "─".repeat((width as usize).saturating_sub(2)));
-    execute!(stdout, MoveToColumn(width - 1)).ok();
-    print!("┘\r\n");
-    execute!(stdout, ResetColor).ok();
 }
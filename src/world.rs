@@ -13,7 +13,9 @@ impl WorldEngine {
     pub fn new() -> anyhow::Result<Self> {
         let root =
             default_construct_root().context("Critical: Could not find user home directory")?;
-        Ok(WorldEngine { root_path: root })
+        Ok(WorldEngine {
+            root_path: root.to_path_buf(),
+        })
     }
 
     /// Returns true if the Construct root directory still exists on disk.
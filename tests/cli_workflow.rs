@@ -332,6 +332,60 @@ fn chapter_transition_triggers_setup() {
         .stdout(predicates::str::contains("Gamma acknowledged"));
 }
 
+/// `--check --refresh` must redraw the next task's card in the same process
+/// when a task completes, while keeping the exit-code-2 contract.
+#[test]
+fn check_with_refresh_redraws_status_in_process() {
+    let temp = TempDir::new().expect("failed to create temp dir");
+    setup_mock_quest(&temp);
+
+    let mut cmd = supershell();
+    test_env(&mut cmd, &temp)
+        .arg("--check")
+        .arg("echo alpha")
+        .arg("--refresh")
+        .assert()
+        .code(2)
+        .stdout(predicates::str::contains("Alpha acknowledged"))
+        .stdout(predicates::str::contains("Run echo beta"));
+}
+
+/// An irrelevant command must stay silent even when `--refresh` is passed.
+#[test]
+fn check_with_refresh_is_silent_for_irrelevant_command() {
+    let temp = TempDir::new().expect("failed to create temp dir");
+    setup_mock_quest(&temp);
+
+    let mut cmd = supershell();
+    test_env(&mut cmd, &temp)
+        .arg("--check")
+        .arg("pwd")
+        .arg("--refresh")
+        .assert()
+        .code(0)
+        .stdout("");
+}
+
+/// Once the module is finished every command is irrelevant: exit 0, no output.
+#[test]
+fn check_is_noop_when_module_finished() {
+    let temp = TempDir::new().expect("failed to create temp dir");
+    setup_mock_quest(&temp);
+    fs::write(
+        temp.path().join("supershell").join("save.json"),
+        r#"{"current_course":"mock_quest.yaml","course_version":"0.1.0","current_quest_id":"mock","current_chapter_index":2,"current_task_index":0,"flags":{},"variables":{},"is_finished":true}"#,
+    )
+    .expect("failed to write save.json");
+
+    let mut cmd = supershell();
+    test_env(&mut cmd, &temp)
+        .arg("--check")
+        .arg("echo alpha")
+        .assert()
+        .code(0)
+        .stdout("");
+}
+
 // ── M3 tests (interactive menu) ──────────────────────────────────────────────
 
 /// With a single module available --menu must auto-select it without blocking
@@ -434,6 +488,23 @@ fn history_contains_fails_when_pattern_absent() {
         .stdout(predicates::str::contains("Run 'echo alpha' first"));
 }
 
+/// A non-UTF-8 byte elsewhere in the history file must not hide the pattern.
+#[test]
+fn history_contains_tolerates_non_utf8_history() {
+    let temp = TempDir::new().expect("failed to create temp dir");
+    let histfile = setup_history_quest(&temp, "ls\n");
+    fs::write(&histfile, b"ls\n\xff\xfe\necho alpha\n").expect("failed to write history file");
+
+    let mut cmd = supershell();
+    test_env(&mut cmd, &temp)
+        .env("HISTFILE", &histfile)
+        .arg("--check")
+        .arg("echo trigger")
+        .assert()
+        .code(2)
+        .stdout(predicates::str::contains("History verified"));
+}
+
 /// SetFlag rewards must persist and enable logic-gated tasks in a later
 /// invocation. Without the reward the gated task fails; after the reward it
 /// succeeds.